@@ -0,0 +1,257 @@
+import asyncio
+import csv
+import io
+import json
+import re
+import time
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.utils import utcnow
+import yaml
+
+from database import AsyncDatabase
+from giveaway import Giveaway
+from utils import parse_duration, parse_role_weights, publish_giveaway
+
+MAX_ROWS = 100
+MAX_FILE_BYTES = 1024 * 1024
+# Messages posted at once; discord.py queues the rest behind its rate limits.
+CONCURRENCY = 3
+RETRIES = 3
+
+
+def _load_rows(filename: str, data: bytes) -> list[dict]:
+    """Read a CSV, JSON or YAML schedule into a list of row dicts."""
+    ext = filename.rsplit(".", 1)[-1].lower()
+    if ext not in ("csv", "json", "yaml", "yml"):
+        raise ValueError("❌ Unsupported file type. Upload a .csv, .json or .yaml file.")
+
+    try:
+        text = data.decode("utf-8-sig")
+        if ext == "csv":
+            return list(csv.DictReader(io.StringIO(text)))
+        rows = json.loads(text) if ext == "json" else yaml.safe_load(text)
+    except Exception as e:
+        raise ValueError(f"❌ Could not read {filename}: {e}")
+
+    if isinstance(rows, dict):
+        rows = rows.get("giveaways")
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError("❌ The file must contain a list of giveaways.")
+    return rows
+
+
+def _field(row: dict, key: str):
+    value = row.get(key)
+    if value is None or str(value).strip() == "":
+        return None
+    return str(value).strip()
+
+
+def _snowflake(text: str) -> int:
+    """Accept a raw ID or a channel/role/user mention."""
+    match = re.fullmatch(r"(?:<[#@][&!]?)?(\d+)>?", text)
+    if not match:
+        raise ValueError(f"'{text}' is not an ID or mention")
+    return int(match.group(1))
+
+
+def _yes(row: dict, key: str) -> int:
+    value = (_field(row, key) or "no").lower()
+    if value not in ("yes", "no", "true", "false", "1", "0"):
+        raise ValueError(f"{key} must be yes or no")
+    return int(value in ("yes", "true", "1"))
+
+
+def _build_giveaway(
+    row: dict, interaction: discord.Interaction, now: int
+) -> Giveaway:
+    """Validate one schedule row. Raises ValueError describing the first problem."""
+    guild = interaction.guild
+
+    channel = interaction.channel
+    if _field(row, "channel"):
+        channel = guild.get_channel(_snowflake(_field(row, "channel")))
+        if not isinstance(channel, discord.TextChannel):
+            raise ValueError("channel not found in this server")
+
+    role_id = None
+    if _field(row, "required_role"):
+        role_id = _snowflake(_field(row, "required_role"))
+        if guild.get_role(role_id) is None:
+            raise ValueError("required_role not found in this server")
+
+    host_id = _snowflake(_field(row, "host")) if _field(row, "host") else None
+
+    try:
+        winners_count = int(_field(row, "winners_count") or 1)
+    except ValueError:
+        raise ValueError("winners_count must be a number")
+    if winners_count < 1:
+        raise ValueError("winners_count must be at least 1")
+
+    duration = parse_duration(_field(row, "duration") or "1d")
+    if duration <= 0:
+        raise ValueError("duration must be longer than 0s")
+
+    starts_at = now
+    if _field(row, "starts_at"):
+        try:
+            starts_at = int(_field(row, "starts_at"))
+        except ValueError:
+            raise ValueError("starts_at must be a unix timestamp")
+    elif _field(row, "starts_in"):
+        starts_at = now + parse_duration(_field(row, "starts_in"))
+    scheduled = int(starts_at > now)
+    starts_at = max(starts_at, now)
+
+    weights = _field(row, "role_weights")
+    return Giveaway(
+        None,
+        guild.id,
+        channel.id,
+        None,
+        _field(row, "title") or "Giveaway",
+        _field(row, "prize") or "Surprise!",
+        _field(row, "criteria"),
+        winners_count,
+        starts_at,
+        starts_at + duration,
+        interaction.user.id,
+        host_id,
+        role_id,
+        _yes(row, "ping_role"),
+        _yes(row, "recurring"),
+        1,
+        parse_role_weights(weights) if weights else None,
+        scheduled,
+    )
+
+
+class GiveawayBulkCreate(commands.Cog):
+    def __init__(self, bot: commands.Bot, db: AsyncDatabase):
+        self.bot = bot
+        self.db = db
+
+    @app_commands.command(
+        name="giveaway_bulk_create",
+        description="Create many giveaways from a CSV, JSON or YAML schedule file.",
+    )
+    @app_commands.describe(
+        schedule="File with one giveaway per row/item. Columns: title, prize, winners_count, duration, channel, "
+        "starts_in or starts_at, required_role, ping_role, host, recurring, criteria, role_weights",
+    )
+    @app_commands.default_permissions(manage_guild=True)
+    async def bulk_create(
+        self, interaction: discord.Interaction, schedule: discord.Attachment
+    ):
+        await interaction.response.defer(ephemeral=True)
+
+        if schedule.size > MAX_FILE_BYTES:
+            return await interaction.followup.send(
+                "❌ Schedule file is too large (max 1 MB).", ephemeral=True
+            )
+        try:
+            rows = _load_rows(schedule.filename, await schedule.read())
+        except ValueError as e:
+            return await interaction.followup.send(str(e), ephemeral=True)
+        if not rows:
+            return await interaction.followup.send(
+                "⚠️ The schedule file has no giveaways.", ephemeral=True
+            )
+        if len(rows) > MAX_ROWS:
+            return await interaction.followup.send(
+                f"❌ Too many giveaways ({len(rows)}). The limit is {MAX_ROWS} per file.",
+                ephemeral=True,
+            )
+
+        # Validate every row before touching the database
+        now = int(utcnow().timestamp())
+        giveaways, errors = [], []
+        for number, row in enumerate(rows, start=1):
+            try:
+                giveaways.append(_build_giveaway(row, interaction, now))
+            except ValueError as e:
+                errors.append(f"Row {number}: {str(e).lstrip('❌ ')}")
+        if errors:
+            return await interaction.followup.send(
+                self._report("❌ Nothing was created. Fix these rows and upload again:", errors),
+                ephemeral=True,
+            )
+
+        ids = await self.db.add_giveaways(giveaways)
+        for giveaway, giveaway_id in zip(giveaways, ids):
+            giveaway.id = giveaway_id
+
+        # Post the ones that start now through a bounded pipeline
+        to_post = [(n, g) for n, g in enumerate(giveaways, start=1) if not g.scheduled]
+        progress = await interaction.followup.send(
+            f"⏳ Posting 0/{len(to_post)} giveaways...", ephemeral=True, wait=True
+        )
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        failures = []
+        done = 0
+        last_update = time.monotonic()
+
+        async def post(number: int, giveaway: Giveaway):
+            nonlocal done, last_update
+            async with semaphore:
+                error = await self._publish_with_retry(giveaway)
+            if error:
+                failures.append(f"Row {number}: {error}")
+                await self.db.delete_giveaway(giveaway.id)
+            done += 1
+            if time.monotonic() - last_update > 2:
+                last_update = time.monotonic()
+                await progress.edit(
+                    content=f"⏳ Posting {done}/{len(to_post)} giveaways..."
+                )
+
+        await asyncio.gather(*(post(n, g) for n, g in to_post))
+
+        # Hand everything to the scheduler so start and end times are exact
+        tasks = self.bot.get_cog("GiveawayTasks")
+        if tasks:
+            now = int(utcnow().timestamp())
+            for giveaway in giveaways:
+                if giveaway.id in tasks.active_tasks:
+                    # The failsafe loop got to it first
+                    continue
+                if giveaway.scheduled:
+                    tasks.schedule_start_task(giveaway, giveaway.created_at - now)
+                elif giveaway.message_id:
+                    tasks.schedule_giveaway_task(giveaway, giveaway.ends_at - now)
+
+        scheduled = sum(g.scheduled for g in giveaways)
+        posted = len(to_post) - len(failures)
+        summary = f"✅ Created {posted + scheduled} giveaways ({posted} posted now, {scheduled} scheduled)."
+        if failures:
+            summary = self._report(summary + f"\n⚠️ {len(failures)} failed:", failures)
+        await progress.edit(content=summary)
+
+    async def _publish_with_retry(self, giveaway: Giveaway):
+        """Post a giveaway, backing off on rate limits and server errors."""
+        for attempt in range(RETRIES):
+            try:
+                await publish_giveaway(self.bot, self.db, giveaway)
+                return None
+            except discord.HTTPException as e:
+                if giveaway.message_id:
+                    # The giveaway is up; only the role ping failed.
+                    return None
+                retryable = e.status == 429 or e.status >= 500
+                if not retryable or attempt == RETRIES - 1:
+                    return e.text or str(e)
+                await asyncio.sleep(2**attempt)
+
+    @staticmethod
+    def _report(header: str, lines: list[str]) -> str:
+        """Fit a header and as many lines as possible in one Discord message."""
+        text = header
+        for i, line in enumerate(lines):
+            if len(text) + len(line) > 1900:
+                return text + f"\n…and {len(lines) - i} more."
+            text += "\n" + line
+        return text
@@ -5,7 +5,7 @@ from discord.utils import utcnow
 
 from database import AsyncDatabase
 from giveaway import Giveaway
-from utils import parse_duration, post_giveaway
+from utils import parse_duration, parse_role_weights, post_giveaway
 
 from typing import Literal
 
@@ -27,6 +27,7 @@ class GiveawayCreate(commands.Cog):
         host="User hosting the giveaway. Default: You",
         recurring="Should the giveaway repeat automatically after it ends? Default: no",
         criteria="Participation criteria to display in the giveaway. Note: the bot does not enforce this; users are responsible for following it. Default: None",
+        role_weights="Bonus entries per role, e.g. '@Booster 3, @Supporter 2'. Members get their best bonus. Default: None",
     )
     async def giveaway_create(
         self,
@@ -41,6 +42,7 @@ class GiveawayCreate(commands.Cog):
         host: discord.Member = None,
         recurring: Literal["yes", "no"] = "no",
         criteria: str = None,
+        role_weights: str = None,
     ):
         await interaction.response.defer(ephemeral=True)
         channel = channel or interaction.channel
@@ -55,6 +57,11 @@ class GiveawayCreate(commands.Cog):
                 ephemeral=True,
             )
 
+        try:
+            weights = parse_role_weights(role_weights) if role_weights else None
+        except ValueError as e:
+            return await interaction.followup.send(str(e), ephemeral=True)
+
         await post_giveaway(
             self.bot,
             self.db,
@@ -75,6 +82,7 @@ class GiveawayCreate(commands.Cog):
                 int(ping_role == "yes"),
                 int(recurring == "yes"),
                 1,
+                weights,
             ),
         )
         await interaction.followup.send(
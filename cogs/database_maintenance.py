@@ -0,0 +1,103 @@
+import datetime
+import os
+
+from discord.ext import commands, tasks
+from discord.utils import utcnow
+
+from database import AsyncDatabase
+
+
+class DatabaseMaintenance(commands.Cog):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        db: AsyncDatabase,
+        backup_dir: str = "backups",
+        keep_backups: int = 7,
+        off_peak: datetime.time = datetime.time(hour=4, tzinfo=datetime.timezone.utc),
+        checkpoint_minutes: float = 15,
+    ):
+        self.bot = bot
+        self.db = db
+        self.backup_dir = backup_dir
+        self.keep_backups = keep_backups
+        self.checkpoint_loop.change_interval(minutes=checkpoint_minutes)
+        self.nightly_loop.change_interval(time=off_peak)
+        self.checkpoint_loop.start()
+        self.nightly_loop.start()
+
+    def cog_unload(self):
+        self.checkpoint_loop.cancel()
+        self.nightly_loop.cancel()
+
+    @tasks.loop(minutes=15)
+    async def checkpoint_loop(self):
+        """Keep the WAL short without waiting on readers."""
+        try:
+            await self.db.checkpoint("PASSIVE")
+        except Exception as e:
+            print(f"⚠️ WAL checkpoint failed: {e}")
+
+    @tasks.loop(time=datetime.time(hour=4, tzinfo=datetime.timezone.utc))
+    async def nightly_loop(self):
+        """Off-peak housekeeping: planner stats, free pages, WAL reset and backup."""
+        # Each step runs on its own; an exception would otherwise stop the loop.
+        try:
+            await self.db.optimize()
+        except Exception as e:
+            print(f"⚠️ PRAGMA optimize failed: {e}")
+
+        try:
+            if await self.db.vacuum_if_pending():
+                print("✅ Database rebuilt with the profile's auto_vacuum mode.")
+        except Exception as e:
+            print(f"⚠️ Full VACUUM failed: {e}")
+
+        freed = 0
+        try:
+            freed = await self.db.incremental_vacuum()
+        except Exception as e:
+            print(f"⚠️ Incremental vacuum failed: {e}")
+
+        try:
+            busy, _, _ = await self.db.checkpoint("TRUNCATE")
+            if busy:
+                print("⚠️ WAL checkpoint could not complete; readers were active.")
+        except Exception as e:
+            print(f"⚠️ WAL checkpoint failed: {e}")
+
+        dest = None
+        try:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            stamp = utcnow().strftime("%Y%m%d-%H%M%S")
+            dest = os.path.join(self.backup_dir, f"giveaways-{stamp}.db")
+            await self.db.backup(dest)
+        except Exception as e:
+            print(f"⚠️ Backup to {dest or self.backup_dir} failed: {e}")
+            dest = None
+
+        try:
+            self._rotate_backups()
+        except OSError as e:
+            print(f"⚠️ Could not remove old backups: {e}")
+
+        print(f"✅ Database maintenance done ({freed} free pages reclaimed, backup: {dest or 'failed'}).")
+        print(f"Giveaway cache: {self.db.cache_stats()}")
+
+    def _rotate_backups(self):
+        # A sharded database writes several files per run, all sharing a stamp.
+        files = [
+            f
+            for f in os.listdir(self.backup_dir)
+            if f.startswith("giveaways-") and f.endswith(".db")
+        ]
+        stamps = sorted({f.split(".")[0] for f in files})
+        expired = set(stamps[: -self.keep_backups])
+        for name in files:
+            if name.split(".")[0] in expired:
+                os.remove(os.path.join(self.backup_dir, name))
+
+    @checkpoint_loop.before_loop
+    @nightly_loop.before_loop
+    async def before_maintenance(self):
+        await self.bot.wait_until_ready()
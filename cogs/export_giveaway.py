@@ -0,0 +1,100 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from database import AsyncDatabase
+
+from typing import Literal
+
+# Exports with more rows than this are gzip-compressed.
+GZIP_THRESHOLD = 10_000
+
+
+class GiveawayExport(commands.Cog):
+    def __init__(self, bot: commands.Bot, db: AsyncDatabase):
+        self.bot = bot
+        self.db = db
+
+    @app_commands.command(
+        name="giveaway_export",
+        description="Export a giveaway's participants and winners as a file.",
+    )
+    @app_commands.describe(
+        giveaway_id="The ID of the giveaway to export",
+        file_format="File format of the export. Default: csv",
+    )
+    async def export(
+        self,
+        interaction: discord.Interaction,
+        giveaway_id: int,
+        file_format: Literal["csv", "jsonl"] = "csv",
+    ):
+        await interaction.response.defer(ephemeral=True)
+
+        giveaway = await self.db.get_giveaway(giveaway_id)
+        if not giveaway:
+            return await interaction.followup.send(
+                f"❌ Giveaway with ID **{giveaway_id}** not found.", ephemeral=True
+            )
+
+        # Make sure command is being run in the same guild as the giveaway
+        if giveaway.guild_id != interaction.guild.id:
+            return await interaction.followup.send(
+                "⚠️ This giveaway does not belong to this server.",
+                ephemeral=True,
+            )
+
+        # Permission check: admin or giveaway creator
+        member = interaction.user
+        if not (
+            member.guild_permissions.administrator or member.id == giveaway.creator_id
+        ):
+            return await interaction.followup.send(
+                "⚠️ Only the giveaway creator or a server administrator can export this giveaway.",
+                ephemeral=True,
+            )
+
+        # Stream rows from the DB straight into a temp file on disk
+        compress = await self.db.count_participants(giveaway.id) > GZIP_THRESHOLD
+        filename = f"giveaway-{giveaway.id}.{file_format}" + (".gz" if compress else "")
+        fp = tempfile.TemporaryFile()
+        raw = gzip.GzipFile(fileobj=fp, mode="wb") if compress else fp
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        try:
+            writer = csv.writer(text)
+            if file_format == "csv":
+                writer.writerow(("kind", "user_id", "weight"))
+            async for chunk in self.db.export_rows(giveaway.id):
+                if file_format == "csv":
+                    writer.writerows(chunk)
+                else:
+                    text.writelines(
+                        json.dumps({"kind": k, "user_id": uid, "weight": w}) + "\n"
+                        for k, uid, w in chunk
+                    )
+            text.flush()
+            text.detach()
+            if compress:
+                raw.close()  # writes the gzip trailer, leaves fp open
+
+            size = fp.tell()
+            if size > interaction.guild.filesize_limit:
+                return await interaction.followup.send(
+                    f"⚠️ The export is {size // (1024 * 1024)} MB, above this server's upload limit.",
+                    ephemeral=True,
+                )
+
+            fp.seek(0)
+            await interaction.followup.send(
+                f"📄 Export of **{giveaway.title}**",
+                file=discord.File(fp, filename=filename),
+                ephemeral=True,
+            )
+        finally:
+            fp.close()
@@ -1,12 +1,13 @@
 import asyncio
-from dataclasses import replace
 
+import discord
 from discord.ext import commands, tasks
 from discord.utils import utcnow
 
+from cogs.giveaway_view import GiveawayView
 from database import AsyncDatabase
 from giveaway import Giveaway
-from utils import end_giveaway, post_giveaway, announce_winner
+from utils import end_giveaway, publish_giveaway, render_giveaway, announce_winner
 
 
 class GiveawayTasks(commands.Cog):
@@ -14,6 +15,9 @@ class GiveawayTasks(commands.Cog):
         self.bot = bot
         self.db = db
         self.active_tasks = {}
+        # Next series instances rendered ahead of their start: id -> (giveaway, embed, view)
+        self.prepared = {}
+        self.started_at = int(utcnow().timestamp())
         self.failsafe_loop.start()
         bot.loop.create_task(self.schedule_existing_giveaways())
 
@@ -29,6 +33,17 @@ class GiveawayTasks(commands.Cog):
         now = int(utcnow().timestamp())
         active_giveaways = await self.db.get_giveaways(active=1)
         for giveaway in active_giveaways:
+            if giveaway.scheduled:
+                self.schedule_start_task(giveaway, giveaway.created_at - now)
+                continue
+            if giveaway.message_id is None:
+                if giveaway.created_at >= self.started_at:
+                    # Being posted right now by the command that created it
+                    continue
+                # Left behind by a post that was cut off before the restart
+                print(f"⚠️ Giveaway {giveaway.id} was never posted. Removing it.")
+                await self.db.delete_giveaway(giveaway.id)
+                continue
             remaining = giveaway.ends_at - now
             if remaining <= 0:
                 # Already overdue, handle in failsafe loop
@@ -43,15 +58,77 @@ class GiveawayTasks(commands.Cog):
         task = self.bot.loop.create_task(self._giveaway_task(giveaway, delay))
         self.active_tasks[giveaway.id] = task
 
+    def schedule_start_task(self, giveaway: Giveaway, delay: float):
+        """Schedule a not-yet-posted giveaway to be posted, then ended."""
+        if giveaway.id in self.active_tasks:
+            self.active_tasks[giveaway.id].cancel()
+
+        task = self.bot.loop.create_task(self._start_task(giveaway, max(delay, 0)))
+        self.active_tasks[giveaway.id] = task
+
+    async def _start_task(self, giveaway: Giveaway, delay: float):
+        """Waits for the start time, posts the giveaway and runs it to the end."""
+        try:
+            await asyncio.sleep(delay)
+            g = await self.db.get_giveaway(giveaway.id)
+            if not g or not g.active or not g.scheduled:
+                return
+            embed = view = None
+            if g.id in self.prepared:
+                g, embed, view = self.prepared.pop(g.id)
+            if self.bot.get_channel(g.channel_id) is None:
+                print(f"⚠️ Channel {g.channel_id} not found for giveaway {g.id}.")
+                await self.db.set_inactive(g.id)
+                return
+            try:
+                await publish_giveaway(self.bot, self.db, g, embed=embed, view=view)
+            except discord.HTTPException as e:
+                print(f"⚠️ Failed to post scheduled giveaway {g.id}: {e}")
+                await self.db.set_inactive(g.id)
+                return
+            if g.recurring:
+                await self.stage_next(g)
+            await asyncio.sleep(g.ends_at - int(utcnow().timestamp()))
+            await self.end_giveaway_process(g)
+        except asyncio.CancelledError:
+            return
+        finally:
+            # A replacement task may already own this id; leave its entries alone.
+            if self.active_tasks.get(giveaway.id) is asyncio.current_task():
+                self.active_tasks.pop(giveaway.id)
+                self.prepared.pop(giveaway.id, None)
+
     async def _giveaway_task(self, giveaway: Giveaway, delay: float):
         """Waits for the delay and ends the giveaway."""
         try:
+            if giveaway.recurring:
+                await self.stage_next(giveaway)
             await asyncio.sleep(delay)
             await self.end_giveaway_process(giveaway)
         except asyncio.CancelledError:
             return
         finally:
-            self.active_tasks.pop(giveaway.id, None)
+            if self.active_tasks.get(giveaway.id) is asyncio.current_task():
+                self.active_tasks.pop(giveaway.id)
+
+    async def stage_next(self, giveaway: Giveaway):
+        """
+        Make sure the next instance of a recurring giveaway is already in the
+        database, rendered and scheduled to post the moment this one ends.
+        """
+        if giveaway.series_id is None:
+            await self.db.make_series(giveaway)
+        now = int(utcnow().timestamp())
+        nxt = await self.db.next_instance(giveaway, now)
+        if nxt is None:
+            return
+        if nxt.id is None:
+            nxt = await self.db.get_giveaway(await self.db.add_giveaway(nxt))
+        if nxt.id not in self.prepared:
+            view = GiveawayView(self.db, nxt, 0)
+            self.prepared[nxt.id] = (nxt, render_giveaway(nxt), view)
+        if nxt.id not in self.active_tasks:
+            self.schedule_start_task(nxt, nxt.created_at - now)
 
     async def end_giveaway_process(self, giveaway: Giveaway):
         """Ends a giveaway and announces winners."""
@@ -60,6 +137,10 @@ class GiveawayTasks(commands.Cog):
             print("⚠️ Giveaway was deleted or stopped")
             return
 
+        # Normally staged already; covers giveaways that ended while offline.
+        if g.recurring:
+            await self.stage_next(g)
+
         await self.db.set_inactive(giveaway.id)
         channel = self.bot.get_channel(giveaway.channel_id)
         if not channel:
@@ -71,36 +152,25 @@ class GiveawayTasks(commands.Cog):
         await end_giveaway(self.bot, self.db, giveaway, channel)
         await announce_winner(self.db, giveaway, channel)
 
-        # Handle recurring giveaways
-        if giveaway.recurring:
-            created_at = int(utcnow().timestamp())
-            ends_at = created_at + giveaway.ends_at - giveaway.created_at
-            new_giveaway = replace(
-                giveaway,
-                id=None,
-                message_id=None,
-                created_at=created_at,
-                ends_at=ends_at,
-                active=1,
-            )
-            await post_giveaway(self.bot, self.db, new_giveaway)
-            self.schedule_giveaway_task(
-                new_giveaway, ends_at - int(utcnow().timestamp())
-            )
-
     @tasks.loop(minutes=1)
     async def failsafe_loop(self):
         """Periodic sweep to catch any giveaways that were missed (bot restart, crashes, etc.)."""
         now = int(utcnow().timestamp())
-        active_giveaways = await self.db.get_giveaways(active=1)
-        for giveaway in active_giveaways:
-            remaining = giveaway.ends_at - now
+        timers = await self.db.get_active_timers()
+        for giveaway_id, created_at, ends_at, scheduled in timers:
+            if giveaway_id in self.active_tasks:
+                continue
+            giveaway = await self.db.get_giveaway(giveaway_id)
+            if giveaway is None:
+                continue
+            if scheduled:
+                self.schedule_start_task(giveaway, created_at - now)
+                continue
+            remaining = ends_at - now
             if remaining <= 0:
-                if giveaway.id not in self.active_tasks:
-                    await self.end_giveaway_process(giveaway)
+                await self.end_giveaway_process(giveaway)
             else:
-                if giveaway.id not in self.active_tasks:
-                    self.schedule_giveaway_task(giveaway, remaining)
+                self.schedule_giveaway_task(giveaway, remaining)
 
     @failsafe_loop.before_loop
     async def before_failsafe(self):
@@ -77,7 +77,10 @@ class GiveawayView(discord.ui.View):
             await self.db.rem_participant(interaction.user.id, self.giveaway.id)
             msg_text = f"❌ You have left the giveaway **{self.giveaway.title}**."
         else:
-            await self.db.add_participant(interaction.user.id, self.giveaway.id)
+            weight = self.giveaway.entry_weight(r.id for r in interaction.user.roles)
+            await self.db.add_participant(
+                interaction.user.id, self.giveaway.id, weight
+            )
             msg_text = f"✅ Your entry to **{self.giveaway.title}** has been approved!"
 
         # Update participant count on the button
@@ -0,0 +1,117 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.utils import utcnow
+
+from database import AsyncDatabase
+from utils import parse_duration
+
+from typing import Literal
+
+PAGE_SIZE = 10
+
+
+class GiveawayListView(discord.ui.View):
+    """Previous/Next buttons over keyset-paginated giveaway pages."""
+
+    def __init__(self, db: AsyncDatabase, guild_id: int, active: int, filters: dict):
+        super().__init__(timeout=300)
+        self.db = db
+        self.guild_id = guild_id
+        self.active = active
+        self.filters = filters
+        # Cursor each visited page started after; the last one is the current page.
+        self.cursors = [None]
+        self.next_cursor = None
+
+    async def render(self) -> discord.Embed:
+        page = await self.db.list_giveaways(
+            self.guild_id,
+            self.active,
+            after=self.cursors[-1],
+            limit=PAGE_SIZE + 1,
+            newest_first=not self.active,
+            **self.filters,
+        )
+        has_more = len(page) > PAGE_SIZE
+        page = page[:PAGE_SIZE]
+        self.next_cursor = (page[-1][0].ends_at, page[-1][0].id) if has_more else None
+        self.previous.disabled = len(self.cursors) == 1
+        self.next.disabled = not has_more
+
+        status = "Active" if self.active else "Ended"
+        embed = discord.Embed(
+            title=f"{status} Giveaways", color=discord.Color.blurple()
+        )
+        if not page:
+            embed.description = "⚠️ No giveaways match these filters."
+            return embed
+
+        lines = []
+        for g, count in page:
+            if g.scheduled:
+                when = f"Starts <t:{g.created_at}:R>"
+            else:
+                when = f"{'Ends' if self.active else 'Ended'} <t:{g.ends_at}:R>"
+            lines.append(f"**#{g.id}** {g.title} — 🎉 {count} — {when} in <#{g.channel_id}>")
+        embed.description = "\n".join(lines)
+        embed.set_footer(text=f"Page {len(self.cursors)}")
+        return embed
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        self.cursors.pop()
+        embed = await self.render()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(self.next_cursor)
+        embed = await self.render()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+
+class GiveawayList(commands.Cog):
+    def __init__(self, bot: commands.Bot, db: AsyncDatabase):
+        self.bot = bot
+        self.db = db
+
+    @app_commands.command(
+        name="giveaway_list", description="List this server's giveaways."
+    )
+    @app_commands.describe(
+        status="Show active or ended giveaways. Default: active",
+        channel="Only giveaways posted in this channel. Default: all channels",
+        creator="Only giveaways created by this member. Default: anyone",
+        within="Active: ending within this time. Ended: ended within this time (e.g., 7d). Default: any time",
+    )
+    async def giveaway_list(
+        self,
+        interaction: discord.Interaction,
+        status: Literal["active", "ended"] = "active",
+        channel: discord.TextChannel = None,
+        creator: discord.Member = None,
+        within: str = None,
+    ):
+        await interaction.response.defer(ephemeral=True)
+        active = int(status == "active")
+        filters = {
+            "channel_id": channel.id if channel else None,
+            "creator_id": creator.id if creator else None,
+        }
+        if within:
+            try:
+                window = parse_duration(within)
+            except ValueError as e:
+                return await interaction.followup.send(str(e), ephemeral=True)
+            now = int(utcnow().timestamp())
+            if active:
+                filters["ends_to"] = now + window
+            else:
+                filters["ends_from"] = now - window
+
+        view = GiveawayListView(self.db, interaction.guild.id, active, filters)
+        embed = await view.render()
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
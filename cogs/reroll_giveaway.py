@@ -1,11 +1,15 @@
-import random
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ext.commands import Bot
 
 from database import AsyncDatabase
+from utils import (
+    describe_rejections,
+    draw_was_capped,
+    draw_winners,
+    rejection_cap,
+)
 
 
 class GiveawayReroll(commands.Cog):
@@ -51,18 +55,27 @@ class GiveawayReroll(commands.Cog):
                 ephemeral=True,
             )
 
-        # Get participants
-        participants = await self.db.get_participants(giveaway.id)
-        if not participants:
+        # Pick eligible winners, honouring bonus entries
+        winners, rejected = await draw_winners(self.db, giveaway, interaction.guild)
+        skipped_note = (
+            f"\nSkipped ineligible entrants: {describe_rejections(rejected)}."
+            if rejected
+            else ""
+        )
+        if draw_was_capped(rejected, giveaway.winners_count):
+            skipped_note += (
+                f"\n⚠️ The draw stopped after {rejection_cap(giveaway.winners_count)} "
+                "ineligible entrants."
+            )
+        history = await self.db.get_draw_rejections(giveaway.id)
+        if history and history != rejected:
+            skipped_note += f"\nSkipped over all draws: {describe_rejections(history)}."
+        if not winners:
             return await interaction.followup.send(
-                f"⚠️ No participants joined the giveaway **{giveaway.title}**. Cannot reroll.",
+                f"⚠️ No eligible participants in the giveaway **{giveaway.title}**. Cannot reroll."
+                + skipped_note,
                 ephemeral=True,
             )
-
-        # Pick winners
-        winners = random.sample(
-            participants, k=min(giveaway.winners_count, len(participants))
-        )
         winners_mentions = " ".join(f"<@{uid}>" for uid in winners)
 
         # Clear old winners and store new winners in DB
@@ -84,6 +97,6 @@ class GiveawayReroll(commands.Cog):
         )
 
         await interaction.followup.send(
-            f"✅ Giveaway **{giveaway.title}** has been successfully rerolled.",
+            f"✅ Giveaway **{giveaway.title}** has been successfully rerolled.{skipped_note}",
             ephemeral=True,
         )
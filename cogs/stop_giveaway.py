@@ -58,8 +58,30 @@ class GiveawayStop(commands.Cog):
                 f"⚠️ Giveaway **{giveaway.title}** has already ended.", ephemeral=True
             )
 
-        # Mark giveaway as inactive
+        # Not posted yet: cancel it outright, there is nothing to end or announce
+        if giveaway.scheduled:
+            tasks = self.bot.get_cog("GiveawayTasks")
+            if tasks and giveaway.id in tasks.active_tasks:
+                tasks.active_tasks[giveaway.id].cancel()
+            await self.db.delete_giveaway(giveaway.id)
+            if giveaway.series_id:
+                await self.db.end_series(giveaway)
+            return await interaction.followup.send(
+                f"✅ Scheduled giveaway **{giveaway.title}** was cancelled before it started.",
+                ephemeral=True,
+            )
+
+        # Mark giveaway as inactive; stopping a recurring giveaway ends its series
         await self.db.set_inactive(giveaway.id)
+        series_note = ""
+        if giveaway.series_id:
+            await self.db.end_series(giveaway)
+            stats = await self.db.get_series_stats(giveaway)
+            if stats:
+                series_note = (
+                    f"\n🔁 Series ended after {stats['instances']} run(s) with "
+                    f"{stats['total_entries']} total entries."
+                )
 
         # Fetch the channel
         channel = self.bot.get_channel(giveaway.channel_id)
@@ -75,6 +97,6 @@ class GiveawayStop(commands.Cog):
             await announce_winner(self.db, giveaway, channel)
 
         await interaction.followup.send(
-            f"✅ Giveaway **{giveaway.title}** has been successfully stopped.",
+            f"✅ Giveaway **{giveaway.title}** has been successfully stopped.{series_note}",
             ephemeral=True,
         )
@@ -1,25 +1,246 @@
+import asyncio
+import contextlib
+import os
+import sqlite3
 import aiosqlite
-from dataclasses import asdict
-from typing import List, Optional
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, List, Optional, Tuple
 from giveaway import Giveaway
 
 
+@dataclass(frozen=True)
+class PragmaProfile:
+    """Connection PRAGMAs applied by `AsyncDatabase.connect`."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -16000  # negative values are KiB, positive are pages
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5000  # ms
+    auto_vacuum: str = "INCREMENTAL"
+
+
+PRAGMA_PROFILES = {
+    # Durable after every commit, small footprint.
+    "safe": PragmaProfile(synchronous="FULL", cache_size=-4000, mmap_size=0),
+    # WAL + NORMAL sync: a crash can lose the last commits but never corrupts.
+    "balanced": PragmaProfile(),
+    # For hosts with memory to spare.
+    "fast": PragmaProfile(cache_size=-64000, mmap_size=256 * 1024 * 1024),
+}
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+def _online_backup(
+    src_path: str, dest_path: str, pages: int, sleep: float, max_restarts: int = 5
+):
+    """
+    Copy `src_path` into `dest_path` with SQLite's backup API, `pages` pages per
+    step. Uses its own connections so the bot's writer is never involved; any
+    lock is only held for the duration of a single step.
+    """
+    tmp_path = dest_path + ".part"
+    src = sqlite3.connect(src_path, timeout=30)
+    dst = sqlite3.connect(tmp_path)
+    restarts = 0
+    last_remaining = None
+
+    def progress(status, remaining, total):
+        # A write from another connection makes SQLite restart the copy.
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > max_restarts:
+                raise _BackupRestarted
+        last_remaining = remaining
+
+    try:
+        try:
+            src.backup(dst, pages=pages, progress=progress, sleep=sleep)
+        except _BackupRestarted:
+            # Too busy to finish step by step; copy the rest in one pass.
+            src.backup(dst, pages=-1)
+    except BaseException:
+        dst.close()
+        src.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)  # don't leave a half-written copy behind
+        raise
+    dst.close()
+    src.close()
+    os.replace(tmp_path, dest_path)
+
+
+# Giveaway fields that recurring instances read from their series template.
+SERIES_TEMPLATE_FIELDS = (
+    "title",
+    "prize",
+    "criteria",
+    "winners_count",
+    "creator_id",
+    "host_id",
+    "required_role_id",
+    "ping_role",
+    "role_weights",
+)
+
+
+def _row_data(giveaway: Giveaway) -> dict:
+    """Column values to INSERT for a giveaway."""
+    data = asdict(giveaway)
+    if data.get("id") is None:
+        data.pop("id")
+    if giveaway.series_id is not None:
+        # The template lives on the series row; NOT NULL columns get placeholders.
+        for field in SERIES_TEMPLATE_FIELDS:
+            data[field] = None
+        data.update(title="", prize="", winners_count=0, creator_id=0)
+    return data
+
+
+class GiveawayCache:
+    """
+    LRU of Giveaway records keyed by id. Stores and hands out copies, so callers
+    that mutate a Giveaway never change the cached record.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every write so a read that raced a write is not cached.
+        self.version = 0
+        self._items: "OrderedDict[int, Giveaway]" = OrderedDict()
+
+    def get(self, giveaway_id: int) -> Optional[Giveaway]:
+        giveaway = self._items.get(giveaway_id)
+        if giveaway is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(giveaway_id)
+        self.hits += 1
+        return replace(giveaway)
+
+    def put(self, giveaway: Giveaway):
+        self._items[giveaway.id] = replace(giveaway)
+        self._items.move_to_end(giveaway.id)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def bump(self):
+        """Mark a write as started; reads already in flight are not cached."""
+        self.version += 1
+
+    def update(self, giveaway_id: int, **changes):
+        self.version += 1
+        giveaway = self._items.get(giveaway_id)
+        if giveaway is not None:
+            for field, value in changes.items():
+                setattr(giveaway, field, value)
+
+    def discard(self, giveaway_id: int):
+        self.version += 1
+        self._items.pop(giveaway_id, None)
+
+    def discard_series(self, series_id: int):
+        self.version += 1
+        for giveaway_id in [
+            g.id for g in self._items.values() if g.series_id == series_id
+        ]:
+            del self._items[giveaway_id]
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 class AsyncDatabase:
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        profile: Optional[PragmaProfile] = None,
+        cache_size: int = 1024,
+    ):
         self.path = path
+        self.profile = profile or PRAGMA_PROFILES["balanced"]
         self.con: Optional[aiosqlite.Connection] = None
+        self.cache = GiveawayCache(cache_size)
+        # Set when an existing file needs a full VACUUM to switch auto_vacuum.
+        self.vacuum_pending = False
 
     async def connect(self):
         self.con = await aiosqlite.connect(self.path)
         self.con.row_factory = aiosqlite.Row
+        await self._apply_profile()
         await self.con.execute("PRAGMA foreign_keys = ON")
         await self._create_tables()
+        await self._analyze_if_needed()
+
+    async def _apply_profile(self):
+        p = self.profile
+        # auto_vacuum takes effect at once on a new file. An existing file
+        # needs a full VACUUM, which is left to the off-peak `vacuum_if_pending`.
+        await self.con.execute(f"PRAGMA auto_vacuum = {p.auto_vacuum}")
+        async with self.con.execute("PRAGMA auto_vacuum") as cur:
+            current = (await cur.fetchone())[0]
+        wanted = {"NONE": 0, "FULL": 1, "INCREMENTAL": 2}[p.auto_vacuum.upper()]
+        self.vacuum_pending = current != wanted
+
+        await self.con.execute(f"PRAGMA journal_mode = {p.journal_mode}")
+        await self.con.execute(f"PRAGMA synchronous = {p.synchronous}")
+        await self.con.execute(f"PRAGMA cache_size = {int(p.cache_size)}")
+        await self.con.execute(f"PRAGMA mmap_size = {int(p.mmap_size)}")
+        await self.con.execute(f"PRAGMA temp_store = {p.temp_store}")
+        await self.con.execute(f"PRAGMA busy_timeout = {int(p.busy_timeout)}")
+
+    async def _analyze_if_needed(self):
+        """Give the query planner statistics the first time the file is opened."""
+        async with self.con.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ) as cur:
+            if await cur.fetchone() is None:
+                await self.con.execute("ANALYZE")
+                await self.con.commit()
 
     async def close(self):
         if self.con:
             await self.con.close()
 
     async def _create_tables(self):
+        await self.con.execute("""
+            CREATE TABLE IF NOT EXISTS giveaway_series (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                prize TEXT NOT NULL,
+                criteria TEXT,
+                winners_count INTEGER NOT NULL,
+                duration INTEGER NOT NULL,
+                creator_id INTEGER NOT NULL,
+                host_id INTEGER,
+                required_role_id INTEGER,
+                ping_role INTEGER,
+                role_weights TEXT,
+                active INTEGER DEFAULT 1,
+                next_instance_id INTEGER,
+                instances INTEGER NOT NULL DEFAULT 0,
+                total_entries INTEGER NOT NULL DEFAULT 0,
+                total_winners INTEGER NOT NULL DEFAULT 0
+            )
+        """)
         await self.con.execute("""
             CREATE TABLE IF NOT EXISTS giveaways (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -37,13 +258,17 @@ class AsyncDatabase:
                 required_role_id INTEGER,
                 ping_role INTEGER,
                 recurring INTEGER,
-                active INTEGER DEFAULT 1
+                active INTEGER DEFAULT 1,
+                role_weights TEXT,
+                scheduled INTEGER DEFAULT 0,
+                series_id INTEGER REFERENCES giveaway_series(id)
             );
         """)
         await self.con.execute("""
             CREATE TABLE IF NOT EXISTS participants (
                 giveaway_id INTEGER NOT NULL,
                 user_id INTEGER NOT NULL,
+                weight INTEGER NOT NULL DEFAULT 1,
                 FOREIGN KEY(giveaway_id) REFERENCES giveaways(id) ON DELETE CASCADE
             )
         """)
@@ -54,28 +279,167 @@ class AsyncDatabase:
                 FOREIGN KEY (giveaway_id) REFERENCES giveaways(id) ON DELETE CASCADE
             )
         """)
+        await self.con.execute("""
+            CREATE TABLE IF NOT EXISTS draw_rejections (
+                giveaway_id INTEGER NOT NULL,
+                drawn_at INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                FOREIGN KEY (giveaway_id) REFERENCES giveaways(id) ON DELETE CASCADE
+            )
+        """)
+        await self._add_missing_columns(
+            "giveaways",
+            {
+                "role_weights": "TEXT",
+                "scheduled": "INTEGER DEFAULT 0",
+                "series_id": "INTEGER REFERENCES giveaway_series(id)",
+            },
+        )
+        await self._add_missing_columns(
+            "participants", {"weight": "INTEGER NOT NULL DEFAULT 1"}
+        )
+        await self.con.execute("""
+            CREATE INDEX IF NOT EXISTS idx_giveaways_listing
+            ON giveaways (guild_id, active, ends_at, id)
+        """)
+        await self.con.execute("""
+            CREATE INDEX IF NOT EXISTS idx_participants_giveaway
+            ON participants (giveaway_id)
+        """)
+        await self._create_series_triggers()
+        # Giveaway records as the bot sees them: series instances take their
+        # template from the series row.
+        await self.con.execute("DROP VIEW IF EXISTS giveaway_records")
+        await self.con.execute("""
+            CREATE VIEW giveaway_records AS
+            SELECT g.id, g.guild_id, g.channel_id, g.message_id,
+                COALESCE(s.title, g.title) AS title,
+                COALESCE(s.prize, g.prize) AS prize,
+                COALESCE(s.criteria, g.criteria) AS criteria,
+                COALESCE(s.winners_count, g.winners_count) AS winners_count,
+                g.created_at, g.ends_at,
+                COALESCE(s.creator_id, g.creator_id) AS creator_id,
+                COALESCE(s.host_id, g.host_id) AS host_id,
+                COALESCE(s.required_role_id, g.required_role_id) AS required_role_id,
+                COALESCE(s.ping_role, g.ping_role) AS ping_role,
+                CASE WHEN g.series_id IS NULL THEN g.recurring ELSE s.active END
+                    AS recurring,
+                g.active,
+                COALESCE(s.role_weights, g.role_weights) AS role_weights,
+                g.scheduled, g.series_id
+            FROM giveaways g LEFT JOIN giveaway_series s ON s.id = g.series_id
+        """)
         await self.con.commit()
 
+    async def _create_series_triggers(self):
+        """Keep series bookkeeping in the same statement as the write causing it."""
+        await self.con.execute("""
+            CREATE TRIGGER IF NOT EXISTS series_instance_added
+            AFTER INSERT ON giveaways WHEN NEW.series_id IS NOT NULL
+            BEGIN
+                UPDATE giveaway_series SET next_instance_id = NEW.id
+                WHERE id = NEW.series_id;
+            END
+        """)
+        await self.con.execute("""
+            CREATE TRIGGER IF NOT EXISTS series_instance_ended
+            AFTER UPDATE OF active ON giveaways
+            WHEN NEW.series_id IS NOT NULL AND OLD.active = 1 AND NEW.active = 0
+            BEGIN
+                UPDATE giveaway_series SET
+                    instances = instances + 1,
+                    total_entries = total_entries + (
+                        SELECT COUNT(*) FROM participants WHERE giveaway_id = NEW.id
+                    )
+                WHERE id = NEW.series_id;
+            END
+        """)
+        await self.con.execute("""
+            CREATE TRIGGER IF NOT EXISTS series_winner_added
+            AFTER INSERT ON winners
+            BEGIN
+                UPDATE giveaway_series SET total_winners = total_winners + 1
+                WHERE id = (SELECT series_id FROM giveaways WHERE id = NEW.giveaway_id);
+            END
+        """)
+        await self.con.execute("""
+            CREATE TRIGGER IF NOT EXISTS series_winner_removed
+            AFTER DELETE ON winners
+            BEGIN
+                UPDATE giveaway_series SET total_winners = total_winners - 1
+                WHERE id = (SELECT series_id FROM giveaways WHERE id = OLD.giveaway_id);
+            END
+        """)
+
+    async def _add_missing_columns(self, table: str, columns: Dict[str, str]):
+        """Bring tables created by older versions up to the current schema."""
+        async with self.con.execute(f"PRAGMA table_info({table})") as cur:
+            existing = {row["name"] for row in await cur.fetchall()}
+        for name, definition in columns.items():
+            if name not in existing:
+                await self.con.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {name} {definition}"
+                )
+
     # ---------------- Giveaways ----------------
     async def add_giveaway(self, giveaway: Giveaway):
-        data = asdict(giveaway)
-        if data.get("id") is None:
-            data.pop("id")
-
+        data = _row_data(giveaway)
         columns = ", ".join(data.keys())
         placeholders = ", ".join("?" for _ in data)
         query = f"INSERT INTO giveaways ({columns}) VALUES ({placeholders})"
 
         async with self.con.execute(query, tuple(data.values())) as cur:
             await self.con.commit()
-            return cur.lastrowid
+            giveaway_id = cur.lastrowid
+        if giveaway.series_id is None:
+            # Series instances are cached once read back through the view.
+            self.cache.put(replace(giveaway, id=giveaway_id))
+        return giveaway_id
+
+    async def add_giveaways(self, giveaways: List[Giveaway]) -> List[int]:
+        """
+        Insert several giveaways atomically and return their ids in input order.
+        A single multi-row INSERT, so other coroutines sharing the connection can
+        never commit half of the batch.
+        """
+        rows = [_row_data(giveaway) for giveaway in giveaways]
+        if any("id" in row for row in rows):
+            for row, giveaway in zip(rows, giveaways):
+                row["id"] = giveaway.id
+
+        columns = ", ".join(rows[0].keys())
+        placeholders = ", ".join(
+            "(" + ", ".join("?" for _ in row) + ")" for row in rows
+        )
+        values = tuple(value for row in rows for value in row.values())
+        query = f"INSERT INTO giveaways ({columns}) VALUES {placeholders} RETURNING id"
+
+        async with self.con.execute(query, values) as cur:
+            # Rows get increasing ids in VALUES order.
+            ids = sorted(row["id"] for row in await cur.fetchall())
+        await self.con.commit()
+        for giveaway, giveaway_id in zip(giveaways, ids):
+            if giveaway.series_id is None:
+                self.cache.put(replace(giveaway, id=giveaway_id))
+        return ids
 
     async def get_giveaway(self, giveaway_id: int) -> Optional[Giveaway]:
+        giveaway = self.cache.get(giveaway_id)
+        if giveaway is not None:
+            return giveaway
+
+        version = self.cache.version
         async with self.con.execute(
-            "SELECT * FROM giveaways WHERE id = ?", (giveaway_id,)
+            "SELECT * FROM giveaway_records WHERE id = ?", (giveaway_id,)
         ) as cur:
             row = await cur.fetchone()
-            return Giveaway(**dict(row)) if row else None
+        if not row:
+            return None
+        giveaway = Giveaway(**dict(row))
+        if self.cache.version == version:
+            self.cache.put(giveaway)
+        return giveaway
 
     async def get_giveaways(
         self,
@@ -84,7 +448,7 @@ class AsyncDatabase:
         giveaway_id: Optional[int] = None,
         active: Optional[int] = None,
     ) -> List[Giveaway]:
-        query = "SELECT * FROM giveaways"
+        query = "SELECT * FROM giveaway_records"
         conditions, values = [], []
 
         if guild_id is not None:
@@ -103,32 +467,217 @@ class AsyncDatabase:
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
 
+        version = self.cache.version
         async with self.con.execute(query, tuple(values)) as cur:
             rows = await cur.fetchall()
-            return [Giveaway(**dict(row)) for row in rows]
+        giveaways = [Giveaway(**dict(row)) for row in rows]
+        if self.cache.version == version:
+            # Only live giveaways are hot; caching every ended one from a full
+            # scan would evict them.
+            for giveaway in giveaways:
+                if giveaway.active or giveaway_id is not None:
+                    self.cache.put(giveaway)
+        return giveaways
+
+    async def list_giveaways(
+        self,
+        guild_id: int,
+        active: int,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 10,
+        channel_id: Optional[int] = None,
+        creator_id: Optional[int] = None,
+        ends_from: Optional[int] = None,
+        ends_to: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[Tuple[Giveaway, int]]:
+        """
+        One page of a guild's giveaways with their participant counts, ordered by
+        (ends_at, id). `after` is the (ends_at, id) of the last row of the previous
+        page; seeking past it on idx_giveaways_listing keeps every page equally
+        cheap no matter how much history the guild has.
+        """
+        query = """
+            SELECT g.*, (
+                SELECT COUNT(*) FROM participants p WHERE p.giveaway_id = g.id
+            ) AS participant_count
+            FROM giveaway_records g WHERE guild_id = ? AND active = ?
+        """
+        values = [guild_id, active]
+
+        if after is not None:
+            op = "<" if newest_first else ">"
+            query += f" AND (ends_at, id) {op} (?, ?)"
+            values += after
+        if channel_id is not None:
+            query += " AND channel_id = ?"
+            values.append(channel_id)
+        if creator_id is not None:
+            query += " AND creator_id = ?"
+            values.append(creator_id)
+        if ends_from is not None:
+            query += " AND ends_at >= ?"
+            values.append(ends_from)
+        if ends_to is not None:
+            query += " AND ends_at <= ?"
+            values.append(ends_to)
 
-    async def set_message_id(self, message_id: int, giveaway_id: int):
+        order = "DESC" if newest_first else "ASC"
+        query += f" ORDER BY ends_at {order}, id {order} LIMIT ?"
+        values.append(limit)
+
+        async with self.con.execute(query, tuple(values)) as cur:
+            rows = await cur.fetchall()
+        page = []
+        for row in rows:
+            data = dict(row)
+            count = data.pop("participant_count")
+            page.append((Giveaway(**data), count))
+        return page
+
+    async def get_active_timers(self) -> List[Tuple[int, int, int, int]]:
+        """
+        (id, created_at, ends_at, scheduled) of every active giveaway, without
+        building records. Rows that should be live but are still being posted
+        (no message yet) belong to whoever is posting them and are left out.
+        """
+        async with self.con.execute(
+            "SELECT id, created_at, ends_at, scheduled FROM giveaways "
+            "WHERE active = 1 AND (scheduled = 1 OR message_id IS NOT NULL)"
+        ) as cur:
+            rows = await cur.fetchall()
+            return [tuple(row) for row in rows]
+
+    # Writes bump the cache version first and touch the cached record only
+    # after the commit, so a failed write leaves the cache matching the file.
+    async def set_message_id(
+        self,
+        message_id: int,
+        giveaway_id: int,
+        window: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Mark a giveaway as posted. `window` is a new (created_at, ends_at) for a
+        scheduled giveaway that started late.
+        """
+        changes = {"message_id": message_id, "scheduled": 0}
+        if window is not None:
+            changes.update(created_at=window[0], ends_at=window[1])
+        self.cache.bump()
         await self.con.execute(
-            "UPDATE giveaways SET message_id=? WHERE id=?",
-            (message_id, giveaway_id),
+            f"UPDATE giveaways SET {', '.join(f'{c}=?' for c in changes)} WHERE id=?",
+            (*changes.values(), giveaway_id),
         )
         await self.con.commit()
+        self.cache.update(giveaway_id, **changes)
 
     async def set_inactive(self, giveaway_id: int):
+        self.cache.bump()
         await self.con.execute(
             "UPDATE giveaways SET active=0 WHERE id=?", (giveaway_id,)
         )
         await self.con.commit()
+        self.cache.update(giveaway_id, active=0)
 
     async def delete_giveaway(self, giveaway_id: int):
+        self.cache.bump()
         await self.con.execute("DELETE FROM giveaways WHERE id=?", (giveaway_id,))
         await self.con.commit()
+        self.cache.discard(giveaway_id)
+
+    def cache_stats(self) -> Dict[str, float]:
+        return self.cache.stats()
+
+    # ---------------- Series ----------------
+    async def make_series(self, giveaway: Giveaway) -> int:
+        """Turn a recurring giveaway into the first instance of a new series."""
+        template = {field: getattr(giveaway, field) for field in SERIES_TEMPLATE_FIELDS}
+        template.update(
+            guild_id=giveaway.guild_id,
+            channel_id=giveaway.channel_id,
+            duration=giveaway.ends_at - giveaway.created_at,
+            next_instance_id=giveaway.id,
+        )
+        columns = ", ".join(template.keys())
+        placeholders = ", ".join("?" for _ in template)
+        self.cache.bump()
+        async with self.con.execute(
+            f"INSERT INTO giveaway_series ({columns}) VALUES ({placeholders})",
+            tuple(template.values()),
+        ) as cur:
+            series_id = cur.lastrowid
+        await self.con.execute(
+            "UPDATE giveaways SET series_id=? WHERE id=?", (series_id, giveaway.id)
+        )
+        await self.con.commit()
+        self.cache.update(giveaway.id, series_id=series_id)
+        giveaway.series_id = series_id
+        return series_id
+
+    async def next_instance(self, giveaway: Giveaway, now: int) -> Optional[Giveaway]:
+        """
+        The series instance that follows `giveaway`: the already staged one if it
+        exists, otherwise a new unsaved Giveaway (id None) starting when
+        `giveaway` ends (or at `now` if that has passed). None once the series
+        has been stopped.
+        """
+        async with self.con.execute(
+            "SELECT active, duration, next_instance_id FROM giveaway_series WHERE id=?",
+            (giveaway.series_id,),
+        ) as cur:
+            series = await cur.fetchone()
+        if not series or not series["active"]:
+            return None
+
+        if series["next_instance_id"]:
+            staged = await self.get_giveaway(series["next_instance_id"])
+            if staged and staged.created_at >= giveaway.ends_at:
+                return staged
+
+        starts_at = max(giveaway.ends_at, now)
+        return replace(
+            giveaway,
+            id=None,
+            message_id=None,
+            created_at=starts_at,
+            ends_at=starts_at + series["duration"],
+            active=1,
+            scheduled=1,
+        )
+
+    async def end_series(self, giveaway: Giveaway) -> List[int]:
+        """
+        Stop a series and drop its not-yet-posted instance. Returns the ids of
+        the instances deleted.
+        """
+        self.cache.bump()
+        await self.con.execute(
+            "UPDATE giveaway_series SET active=0 WHERE id=?", (giveaway.series_id,)
+        )
+        async with self.con.execute(
+            "DELETE FROM giveaways WHERE series_id=? AND scheduled=1 RETURNING id",
+            (giveaway.series_id,),
+        ) as cur:
+            deleted = [row["id"] for row in await cur.fetchall()]
+        await self.con.commit()
+        self.cache.discard_series(giveaway.series_id)
+        return deleted
+
+    async def get_series_stats(self, giveaway: Giveaway) -> Optional[Dict[str, int]]:
+        """Running totals for the series `giveaway` belongs to."""
+        async with self.con.execute(
+            "SELECT instances, total_entries, total_winners FROM giveaway_series "
+            "WHERE id=?",
+            (giveaway.series_id,),
+        ) as cur:
+            row = await cur.fetchone()
+            return dict(row) if row else None
 
     # ---------------- Participants ----------------
-    async def add_participant(self, user_id: int, giveaway_id: int):
+    async def add_participant(self, user_id: int, giveaway_id: int, weight: int = 1):
         await self.con.execute(
-            "INSERT INTO participants (giveaway_id, user_id) VALUES (?, ?)",
-            (giveaway_id, user_id),
+            "INSERT INTO participants (giveaway_id, user_id, weight) VALUES (?, ?, ?)",
+            (giveaway_id, user_id, weight),
         )
         await self.con.commit()
 
@@ -146,6 +695,16 @@ class AsyncDatabase:
             rows = await cur.fetchall()
             return [r["user_id"] for r in rows]
 
+    async def iter_entries(self, giveaway_id: int, chunk_size: int = 1000):
+        """Yield (user_id, weight) for every participant, `chunk_size` rows at a time."""
+        async with self.con.execute(
+            "SELECT user_id, weight FROM participants WHERE giveaway_id=?",
+            (giveaway_id,),
+        ) as cur:
+            while rows := await cur.fetchmany(chunk_size):
+                for row in rows:
+                    yield row["user_id"], row["weight"]
+
     async def count_participants(self, giveaway_id: int) -> int:
         async with self.con.execute(
             "SELECT COUNT(*) AS total FROM participants WHERE giveaway_id=?",
@@ -175,3 +734,407 @@ class AsyncDatabase:
             "DELETE FROM winners WHERE giveaway_id = ?", (giveaway_id,)
         )
         await self.con.commit()
+
+    async def add_draw_rejections(
+        self, giveaway_id: int, drawn_at: int, rejections: Dict[str, int]
+    ):
+        """Record how many drawn candidates were skipped at draw time, by reason."""
+        await self.con.executemany(
+            "INSERT INTO draw_rejections (giveaway_id, drawn_at, reason, count) "
+            "VALUES (?, ?, ?, ?)",
+            [(giveaway_id, drawn_at, r, n) for r, n in rejections.items()],
+        )
+        await self.con.commit()
+
+    async def get_draw_rejections(self, giveaway_id: int) -> Dict[str, int]:
+        """Rejections summed over every draw of a giveaway."""
+        async with self.con.execute(
+            "SELECT reason, SUM(count) AS total FROM draw_rejections "
+            "WHERE giveaway_id = ? GROUP BY reason",
+            (giveaway_id,),
+        ) as cur:
+            return {row["reason"]: row["total"] for row in await cur.fetchall()}
+
+    # ---------------- Export ----------------
+    async def export_rows(self, giveaway_id: int, chunk_size: int = 5000):
+        """
+        Yield lists of (kind, user_id, weight) rows, participants then winners.
+        Reads on its own read-only connection so the writer is never held.
+        """
+        uri = Path(self.path).absolute().as_uri() + "?mode=ro"
+        async with aiosqlite.connect(uri, uri=True) as con:
+            for kind, query in (
+                (
+                    "participant",
+                    "SELECT user_id, weight FROM participants WHERE giveaway_id=?",
+                ),
+                ("winner", "SELECT user_id, NULL FROM winners WHERE giveaway_id=?"),
+            ):
+                async with con.execute(query, (giveaway_id,)) as cur:
+                    while rows := await cur.fetchmany(chunk_size):
+                        yield [(kind, user_id, weight) for user_id, weight in rows]
+
+    # ---------------- Maintenance ----------------
+    async def optimize(self):
+        """Refresh planner statistics for tables whose shape has changed."""
+        await self.con.execute("PRAGMA optimize")
+
+    async def incremental_vacuum(self, pages: int = 0) -> int:
+        """
+        Return free pages to the filesystem. `pages=0` frees all of them.
+        Returns the number of free pages before vacuuming.
+        """
+        async with self.con.execute("PRAGMA freelist_count") as cur:
+            free = (await cur.fetchone())[0]
+        if free:
+            async with self.con.execute(f"PRAGMA incremental_vacuum({int(pages)})") as cur:
+                await cur.fetchall()
+        return free
+
+    async def vacuum_if_pending(self) -> bool:
+        """
+        Run the one-off full VACUUM that switches an existing file to the
+        profile's auto_vacuum mode. Blocks the connection while it runs, so it
+        belongs in off-peak maintenance. Returns whether it ran.
+        """
+        if not self.vacuum_pending:
+            return False
+        await self.con.execute("VACUUM")
+        self.vacuum_pending = False
+        return True
+
+    async def checkpoint(self, mode: str = "PASSIVE") -> Tuple[int, int, int]:
+        """Run a WAL checkpoint. Returns (busy, wal_pages, checkpointed_pages)."""
+        async with self.con.execute(f"PRAGMA wal_checkpoint({mode})") as cur:
+            row = await cur.fetchone()
+            return tuple(row)
+
+    async def backup(self, dest_path: str, pages: int = 64, sleep: float = 0.05):
+        """Take an online backup of the database into `dest_path`."""
+        await asyncio.to_thread(_online_backup, self.path, dest_path, pages, sleep)
+
+
+class ShardedDatabase:
+    """
+    Spreads guilds over several AsyncDatabase files so each shard has its own
+    connection and write lock. A small index database hands out globally unique
+    giveaway ids and remembers which shard each one lives in, so lookups by id
+    alone (stop, reroll) still resolve.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        shards: int,
+        profile: Optional[PragmaProfile] = None,
+        cache_size: int = 1024,
+    ):
+        root, ext = os.path.splitext(path)
+        self.path = path
+        self.profile = profile or PRAGMA_PROFILES["balanced"]
+        self.shards = [
+            AsyncDatabase(f"{root}.shard{i}{ext}", self.profile, cache_size)
+            for i in range(shards)
+        ]
+        self.index_path = f"{root}.index{ext}"
+        self.index: Optional[aiosqlite.Connection] = None
+        # Recently resolved giveaway id -> shard number, least recently used first.
+        self._locations: "OrderedDict[int, int]" = OrderedDict()
+        self._locations_size = cache_size * len(self.shards)
+
+    async def connect(self):
+        if await self._unsharded_rows():
+            raise RuntimeError(
+                f"{self.path} still holds giveaways. Sharded mode would ignore them; "
+                "unset DB_SHARDS or move that data out first."
+            )
+        for shard in self.shards:
+            await shard.connect()
+        self.index = await aiosqlite.connect(self.index_path)
+        await self.index.execute(f"PRAGMA journal_mode = {self.profile.journal_mode}")
+        await self.index.execute(f"PRAGMA synchronous = {self.profile.synchronous}")
+        await self.index.execute(f"PRAGMA busy_timeout = {int(self.profile.busy_timeout)}")
+        await self.index.execute("""
+            CREATE TABLE IF NOT EXISTS giveaway_shards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                shard INTEGER NOT NULL
+            )
+        """)
+        await self.index.commit()
+
+    async def _unsharded_rows(self) -> int:
+        """Giveaways left in the single-file database at `path`, if it exists."""
+        if not os.path.exists(self.path):
+            return 0
+        uri = Path(self.path).absolute().as_uri() + "?mode=ro"
+        async with aiosqlite.connect(uri, uri=True) as con:
+            async with con.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'giveaways'"
+            ) as cur:
+                if await cur.fetchone() is None:
+                    return 0
+            async with con.execute("SELECT COUNT(*) FROM giveaways") as cur:
+                return (await cur.fetchone())[0]
+
+    async def close(self):
+        for shard in self.shards:
+            await shard.close()
+        if self.index:
+            await self.index.close()
+
+    # ---------------- Routing ----------------
+    def shard_for_guild(self, guild_id: int) -> AsyncDatabase:
+        return self.shards[guild_id % len(self.shards)]
+
+    def _remember(self, giveaway_id: int, shard: int):
+        self._locations[giveaway_id] = shard
+        self._locations.move_to_end(giveaway_id)
+        while len(self._locations) > self._locations_size:
+            self._locations.popitem(last=False)
+
+    async def shard_for_giveaway(self, giveaway_id: int) -> Optional[AsyncDatabase]:
+        shard = self._locations.get(giveaway_id)
+        if shard is not None:
+            self._locations.move_to_end(giveaway_id)
+        else:
+            async with self.index.execute(
+                "SELECT shard FROM giveaway_shards WHERE id = ?", (giveaway_id,)
+            ) as cur:
+                row = await cur.fetchone()
+            if row is None:
+                return None
+            shard = row[0]
+            self._remember(giveaway_id, shard)
+        return self.shards[shard]
+
+    async def _allocate_id(self, shard: int) -> int:
+        return (await self._allocate_ids(shard, 1))[0]
+
+    async def _allocate_ids(self, shard: int, count: int) -> List[int]:
+        ids = []
+        for _ in range(count):
+            async with self.index.execute(
+                "INSERT INTO giveaway_shards (shard) VALUES (?)", (shard,)
+            ) as cur:
+                ids.append(cur.lastrowid)
+        await self.index.commit()
+        for giveaway_id in ids:
+            self._remember(giveaway_id, shard)
+        return ids
+
+    async def _release_ids(self, ids: List[int]):
+        """Forget index entries whose giveaways no longer exist (or never did)."""
+        for giveaway_id in ids:
+            self._locations.pop(giveaway_id, None)
+        await self.index.executemany(
+            "DELETE FROM giveaway_shards WHERE id = ?", [(i,) for i in ids]
+        )
+        await self.index.commit()
+
+    # ---------------- Giveaways ----------------
+    async def add_giveaway(self, giveaway: Giveaway):
+        number = giveaway.guild_id % len(self.shards)
+        giveaway_id = await self._allocate_id(number)
+        try:
+            return await self.shards[number].add_giveaway(
+                replace(giveaway, id=giveaway_id)
+            )
+        except Exception:
+            await self._release_ids([giveaway_id])
+            raise
+
+    async def add_giveaways(self, giveaways: List[Giveaway]) -> List[int]:
+        """One transaction per shard touched; ids come back in input order."""
+        by_shard: Dict[int, List[int]] = {}
+        for i, giveaway in enumerate(giveaways):
+            by_shard.setdefault(giveaway.guild_id % len(self.shards), []).append(i)
+
+        ids = [None] * len(giveaways)
+        for number, positions in by_shard.items():
+            allocated = await self._allocate_ids(number, len(positions))
+            try:
+                await self.shards[number].add_giveaways(
+                    [replace(giveaways[i], id=gid) for i, gid in zip(positions, allocated)]
+                )
+            except Exception:
+                await self._release_ids(allocated)
+                raise
+            for i, gid in zip(positions, allocated):
+                ids[i] = gid
+        return ids
+
+    async def get_giveaway(self, giveaway_id: int) -> Optional[Giveaway]:
+        shard = await self.shard_for_giveaway(giveaway_id)
+        return await shard.get_giveaway(giveaway_id) if shard else None
+
+    async def get_giveaways(
+        self,
+        guild_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        giveaway_id: Optional[int] = None,
+        active: Optional[int] = None,
+    ) -> List[Giveaway]:
+        if giveaway_id is not None:
+            shard = await self.shard_for_giveaway(giveaway_id)
+            shards = [shard] if shard else []
+        elif guild_id is not None:
+            shards = [self.shard_for_guild(guild_id)]
+        else:
+            shards = self.shards
+
+        giveaways = []
+        for shard in shards:
+            giveaways += await shard.get_giveaways(
+                guild_id, channel_id, giveaway_id, active
+            )
+        return giveaways
+
+    async def list_giveaways(self, guild_id: int, active: int, **kwargs):
+        return await self.shard_for_guild(guild_id).list_giveaways(
+            guild_id, active, **kwargs
+        )
+
+    async def get_active_timers(self) -> List[Tuple[int, int, int, int]]:
+        timers = []
+        for shard in self.shards:
+            timers += await shard.get_active_timers()
+        return timers
+
+    async def set_message_id(
+        self,
+        message_id: int,
+        giveaway_id: int,
+        window: Optional[Tuple[int, int]] = None,
+    ):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.set_message_id(message_id, giveaway_id, window)
+
+    async def set_inactive(self, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.set_inactive(giveaway_id)
+
+    async def delete_giveaway(self, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.delete_giveaway(giveaway_id)
+        await self._release_ids([giveaway_id])
+
+    async def make_series(self, giveaway: Giveaway) -> int:
+        return await self.shard_for_guild(giveaway.guild_id).make_series(giveaway)
+
+    async def next_instance(self, giveaway: Giveaway, now: int) -> Optional[Giveaway]:
+        shard = self.shard_for_guild(giveaway.guild_id)
+        return await shard.next_instance(giveaway, now)
+
+    async def end_series(self, giveaway: Giveaway) -> List[int]:
+        shard = self.shard_for_guild(giveaway.guild_id)
+        deleted = await shard.end_series(giveaway)
+        if deleted:
+            await self._release_ids(deleted)
+        return deleted
+
+    async def get_series_stats(self, giveaway: Giveaway) -> Optional[Dict[str, int]]:
+        shard = self.shard_for_guild(giveaway.guild_id)
+        return await shard.get_series_stats(giveaway)
+
+    def cache_stats(self) -> Dict[str, float]:
+        total = {"size": 0, "capacity": 0, "hits": 0, "misses": 0}
+        for shard in self.shards:
+            for key in total:
+                total[key] += shard.cache.stats()[key]
+        lookups = total["hits"] + total["misses"]
+        total["hit_rate"] = total["hits"] / lookups if lookups else 0.0
+        return total
+
+    # ---------------- Participants ----------------
+    async def add_participant(self, user_id: int, giveaway_id: int, weight: int = 1):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.add_participant(user_id, giveaway_id, weight)
+
+    async def rem_participant(self, user_id: int, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.rem_participant(user_id, giveaway_id)
+
+    async def get_participants(self, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        return await shard.get_participants(giveaway_id) if shard else []
+
+    async def iter_entries(self, giveaway_id: int, chunk_size: int = 1000):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            async for entry in shard.iter_entries(giveaway_id, chunk_size):
+                yield entry
+
+    async def count_participants(self, giveaway_id: int) -> int:
+        shard = await self.shard_for_giveaway(giveaway_id)
+        return await shard.count_participants(giveaway_id) if shard else 0
+
+    # ---------------- Winners ----------------
+    async def add_winners(self, giveaway_id: int, winners: list[int]):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.add_winners(giveaway_id, winners)
+
+    async def get_winners(self, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        return await shard.get_winners(giveaway_id) if shard else []
+
+    async def clear_winners(self, giveaway_id: int):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.clear_winners(giveaway_id)
+
+    async def add_draw_rejections(
+        self, giveaway_id: int, drawn_at: int, rejections: Dict[str, int]
+    ):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            await shard.add_draw_rejections(giveaway_id, drawn_at, rejections)
+
+    async def get_draw_rejections(self, giveaway_id: int) -> Dict[str, int]:
+        shard = await self.shard_for_giveaway(giveaway_id)
+        return await shard.get_draw_rejections(giveaway_id) if shard else {}
+
+    # ---------------- Export ----------------
+    async def export_rows(self, giveaway_id: int, chunk_size: int = 5000):
+        shard = await self.shard_for_giveaway(giveaway_id)
+        if shard:
+            async for chunk in shard.export_rows(giveaway_id, chunk_size):
+                yield chunk
+
+    # ---------------- Maintenance ----------------
+    async def optimize(self):
+        for shard in self.shards:
+            await shard.optimize()
+
+    async def incremental_vacuum(self, pages: int = 0) -> int:
+        freed = 0
+        for shard in self.shards:
+            freed += await shard.incremental_vacuum(pages)
+        return freed
+
+    async def vacuum_if_pending(self) -> bool:
+        ran = False
+        for shard in self.shards:
+            ran = await shard.vacuum_if_pending() or ran
+        return ran
+
+    async def checkpoint(self, mode: str = "PASSIVE") -> Tuple[int, int, int]:
+        busy = wal = done = 0
+        for shard in self.shards:
+            b, w, d = await shard.checkpoint(mode)
+            busy, wal, done = max(busy, b), wal + w, done + d
+        return busy, wal, done
+
+    async def backup(self, dest_path: str, pages: int = 64, sleep: float = 0.05):
+        """Back up every shard and the index next to `dest_path`."""
+        root, ext = os.path.splitext(dest_path)
+        for i, shard in enumerate(self.shards):
+            await shard.backup(f"{root}.shard{i}{ext}", pages, sleep)
+        await asyncio.to_thread(
+            _online_backup, self.index_path, f"{root}.index{ext}", pages, sleep
+        )
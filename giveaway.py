@@ -1,8 +1,9 @@
+import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Giveaway:
     id: Optional[int]
     guild_id: int
@@ -20,3 +21,16 @@ class Giveaway:
     ping_role: Optional[int]
     recurring: Optional[int]
     active: int = 1
+    role_weights: Optional[str] = None  # JSON object: role id -> entries
+    scheduled: int = 0  # 1 until the message is posted at created_at
+    series_id: Optional[int] = None  # recurring instances share a series template
+
+    def role_weight_map(self) -> Dict[int, int]:
+        if not self.role_weights:
+            return {}
+        return {int(k): v for k, v in json.loads(self.role_weights).items()}
+
+    def entry_weight(self, role_ids: Iterable[int]) -> int:
+        """Entries a member gets: the best bonus among their roles, else 1."""
+        weights = self.role_weight_map()
+        return max((weights[r] for r in role_ids if r in weights), default=1)
@@ -1,25 +1,40 @@
 import asyncio
+import datetime
 import os
 
 from dotenv import load_dotenv
 import discord
 from discord.ext.commands import Bot
 
-from database import AsyncDatabase
+from database import AsyncDatabase, ShardedDatabase, PRAGMA_PROFILES
 from utils import restore_views
 
 
+load_dotenv()
 intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
+# Privileged: keeps the member cache current so draws see who left or lost a role.
+intents.members = True
 bot = Bot(command_prefix="!", intents=intents)
 DB_PATH = "giveaways.db"
-db = AsyncDatabase(DB_PATH)
+DB_PROFILE = os.getenv("DB_PROFILE", "balanced")
+BACKUP_DIR = os.getenv("BACKUP_DIR", "backups")
+MAINTENANCE_HOUR = int(os.getenv("MAINTENANCE_HOUR", "4"))  # UTC
+DB_SHARDS = int(os.getenv("DB_SHARDS", "1"))
+if DB_SHARDS > 1:
+    db = ShardedDatabase(DB_PATH, DB_SHARDS, PRAGMA_PROFILES[DB_PROFILE])
+else:
+    db = AsyncDatabase(DB_PATH, PRAGMA_PROFILES[DB_PROFILE])
 
 
 async def load_cogs():
+    from cogs.bulk_create import GiveawayBulkCreate
     from cogs.create_giveaway import GiveawayCreate
+    from cogs.database_maintenance import DatabaseMaintenance
+    from cogs.export_giveaway import GiveawayExport
     from cogs.giveaway_tasks import GiveawayTasks
+    from cogs.list_giveaways import GiveawayList
     from cogs.reroll_giveaway import GiveawayReroll
     from cogs.stop_giveaway import GiveawayStop
 
@@ -27,6 +42,19 @@ async def load_cogs():
     await bot.add_cog(GiveawayTasks(bot, db))
     await bot.add_cog(GiveawayReroll(bot, db))
     await bot.add_cog(GiveawayStop(bot, db))
+    await bot.add_cog(GiveawayList(bot, db))
+    await bot.add_cog(GiveawayExport(bot, db))
+    await bot.add_cog(GiveawayBulkCreate(bot, db))
+    await bot.add_cog(
+        DatabaseMaintenance(
+            bot,
+            db,
+            backup_dir=BACKUP_DIR,
+            off_peak=datetime.time(
+                hour=MAINTENANCE_HOUR, tzinfo=datetime.timezone.utc
+            ),
+        )
+    )
     print("Loaded cogs.")
 
 
@@ -48,10 +76,13 @@ async def on_close():
 
 
 async def main():
-    await db.connect()
+    try:
+        await db.connect()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
     async with bot:
         await load_cogs()
-        load_dotenv()
         TOKEN = os.getenv("DISCORD_TOKEN")
         await bot.start(TOKEN)
 
@@ -1,4 +1,12 @@
+import asyncio
+import hashlib
+import heapq
+import json
+import math
 import random
+import re
+from collections import Counter
+from typing import Optional
 
 import discord
 from discord.ext.commands import Bot
@@ -7,6 +15,18 @@ from database import AsyncDatabase
 from giveaway import Giveaway
 from cogs.giveaway_view import GiveawayView
 
+REJECTED_LEFT_SERVER = "left_server"
+REJECTED_MISSING_ROLE = "missing_role"
+REJECTED_LOOKUP_FAILED = "lookup_failed"
+# A draw gives up after max(MIN_DRAW_REJECTIONS, REJECTIONS_PER_WINNER * k)
+# ineligible candidates and keeps what it has.
+MIN_DRAW_REJECTIONS = 1000
+REJECTIONS_PER_WINNER = 10
+# Member IDs per gateway member request (Discord's limit).
+MEMBER_QUERY_SIZE = 100
+# Seconds a scheduled giveaway may start late before its window is moved.
+LATE_START_GRACE = 60
+
 
 def parse_duration(text: str) -> int:
     """
@@ -26,9 +46,188 @@ def parse_duration(text: str) -> int:
     return total
 
 
+def parse_role_weights(text: str) -> Optional[str]:
+    """
+    Parse bonus entries like '<@&123> 3, <@&456> 2' (role mention or id, then
+    entry count) into the JSON stored on the giveaway.
+    """
+    weights = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        match = re.fullmatch(r"(?:<@&)?(\d+)>?\s*[:=x ]\s*(\d+)", part)
+        if not match or not 1 <= int(match.group(2)) <= 100:
+            raise ValueError(
+                "❌ Invalid role weights. Use like '@Booster 3, @Supporter 2' (1-100 entries)."
+            )
+        weights[match.group(1)] = int(match.group(2))
+    return json.dumps(weights) if weights else None
+
+
+def _entry_key(seed: bytes, user_id: int, weight: int) -> float:
+    """
+    Efraimidis-Spirakis key log(U) / w, larger is better. U comes from hashing
+    the user ID with the draw's seed, so rescanning reproduces the same keys.
+    """
+    digest = hashlib.blake2b(
+        user_id.to_bytes(8, "big"), key=seed, digest_size=8
+    ).digest()
+    u = (int.from_bytes(digest, "big") + 1) / 2**64  # in (0, 1]
+    return math.log(u) / weight
+
+
+async def _ranked_entries(
+    db: AsyncDatabase,
+    giveaway: Giveaway,
+    seed: bytes,
+    count: int,
+    after: Optional[tuple] = None,
+) -> list[tuple[float, int]]:
+    """
+    The next `count` (key, user_id) pairs in draw order, continuing below
+    `after`. One streaming pass over the participants and a heap of size count.
+    """
+    heap = []
+    async for user_id, weight in db.iter_entries(giveaway.id):
+        entry = (_entry_key(seed, user_id, weight), user_id)
+        if after is not None and entry >= after:
+            continue
+        if len(heap) < count:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return sorted(heap, reverse=True)
+
+
+async def fetch_members(guild: discord.Guild, user_ids: list[int]) -> dict:
+    """
+    Resolve user IDs to members of `guild`: from the member cache first, then
+    with gateway member requests of up to 100 IDs for the rest. IDs that are
+    not in the guild are left out; IDs that could not be looked up map to None.
+    """
+    members, missing = {}, []
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member:
+            members[user_id] = member
+        else:
+            missing.append(user_id)
+
+    for i in range(0, len(missing), MEMBER_QUERY_SIZE):
+        chunk = missing[i : i + MEMBER_QUERY_SIZE]
+        try:
+            found = await guild.query_members(
+                user_ids=chunk, limit=MEMBER_QUERY_SIZE, cache=True
+            )
+        except asyncio.TimeoutError:
+            print(f"⚠️ Member request timed out; fetching {len(chunk)} members one by one.")
+            found = []
+            for user_id in chunk:
+                try:
+                    found.append(await guild.fetch_member(user_id))
+                except discord.NotFound:
+                    pass
+                except discord.HTTPException as e:
+                    print(f"⚠️ Could not look up member {user_id}: {e}")
+                    members[user_id] = None
+        members.update((member.id, member) for member in found)
+    return members
+
+
+async def draw_winners(
+    db: AsyncDatabase, giveaway: Giveaway, guild: Optional[discord.Guild] = None
+) -> tuple[list[int], Counter]:
+    """
+    Pick up to `winners_count` distinct participants, each with probability
+    proportional to their entry weight.
+
+    With a `guild`, drawn candidates are checked in draw order, 100 at a time,
+    and skipped if they have left the server or lost the required role. Keys
+    are fixed for the whole draw, so the participants are only rescanned when
+    the ranked candidates run out, each time fetching twice as many. The draw
+    stops early after `rejection_cap(k)` ineligible candidates. Returns the
+    winners and a count of rejected candidates per reason, which is also stored.
+    """
+    seed = random.SystemRandom().randbytes(16)
+    k = giveaway.winners_count
+    cap = rejection_cap(k)
+    if guild is None:
+        ranked = await _ranked_entries(db, giveaway, seed, k)
+        return [user_id for _, user_id in ranked], Counter()
+
+    role = None
+    if giveaway.required_role_id:
+        role = guild.get_role(giveaway.required_role_id)
+
+    winners, rejected, seen = [], Counter(), set()
+
+    def finished() -> bool:
+        return len(winners) == k or rejected.total() >= cap
+
+    after, count = None, k * 2
+    while not finished():
+        ranked = await _ranked_entries(db, giveaway, seed, count, after)
+        if not ranked:
+            break
+        after, count = ranked[-1], count * 2
+        candidates = [user_id for _, user_id in ranked]
+
+        for i in range(0, len(candidates), MEMBER_QUERY_SIZE):
+            chunk = candidates[i : i + MEMBER_QUERY_SIZE]
+            members = await fetch_members(guild, chunk)
+            for user_id in chunk:
+                if finished():
+                    break
+                if user_id in seen:
+                    continue  # duplicate participant row
+                seen.add(user_id)
+                if user_id not in members:
+                    rejected[REJECTED_LEFT_SERVER] += 1
+                elif members[user_id] is None:
+                    rejected[REJECTED_LOOKUP_FAILED] += 1
+                elif role and role not in members[user_id].roles:
+                    rejected[REJECTED_MISSING_ROLE] += 1
+                else:
+                    winners.append(user_id)
+            if finished():
+                break
+
+    if rejected:
+        drawn_at = int(discord.utils.utcnow().timestamp())
+        await db.add_draw_rejections(giveaway.id, drawn_at, rejected)
+    return winners, rejected
+
+
+def rejection_cap(winners_count: int) -> int:
+    """Most ineligible candidates a draw for `winners_count` winners checks."""
+    return max(MIN_DRAW_REJECTIONS, REJECTIONS_PER_WINNER * winners_count)
+
+
+def draw_was_capped(rejected: Counter, winners_count: int) -> bool:
+    """Whether a draw stopped at its rejection cap instead of running out of entrants."""
+    return rejected.total() >= rejection_cap(winners_count)
+
+
+def describe_rejections(rejected: Counter) -> str:
+    labels = {
+        REJECTED_LEFT_SERVER: "left the server",
+        REJECTED_MISSING_ROLE: "missing the required role",
+        REJECTED_LOOKUP_FAILED: "could not be looked up",
+    }
+    return ", ".join(f"{n} {labels.get(reason, reason)}" for reason, n in rejected.items())
+
+
 async def post_giveaway(bot: Bot, db: AsyncDatabase, giveaway: Giveaway):
     giveaway.id = await db.add_giveaway(giveaway)
+    try:
+        await publish_giveaway(bot, db, giveaway)
+    except Exception:
+        if giveaway.message_id is None:
+            # Never appeared in the channel; don't leave a live row behind.
+            await db.delete_giveaway(giveaway.id)
+        raise
 
+
+def render_giveaway(giveaway: Giveaway) -> discord.Embed:
+    """Build the announcement embed for a giveaway that already has an ID."""
     embed = discord.Embed(title=giveaway.title, color=discord.Color.blurple())
     embed.description = (
         f"Click 🎉 button to enter!\n"
@@ -43,15 +242,44 @@ async def post_giveaway(bot: Bot, db: AsyncDatabase, giveaway: Giveaway):
         embed.description += f"Criteria: {giveaway.criteria}\n"
     if giveaway.required_role_id:
         embed.description += f"Must have the role: <@&{giveaway.required_role_id}>\n"
+    if giveaway.role_weights:
+        bonus = ", ".join(
+            f"<@&{role_id}> ×{weight}"
+            for role_id, weight in giveaway.role_weight_map().items()
+        )
+        embed.description += f"Bonus entries: {bonus}\n"
     if giveaway.recurring:
         embed.set_footer(text="This giveaway will recur automatically.")
+    return embed
 
-    view = await GiveawayView.create(db, giveaway)
+
+async def publish_giveaway(
+    bot: Bot,
+    db: AsyncDatabase,
+    giveaway: Giveaway,
+    embed: Optional[discord.Embed] = None,
+    view: Optional[GiveawayView] = None,
+):
+    """
+    Send the message for a giveaway row that is already in the database.
+    `embed` and `view` may be prepared ahead of time. A scheduled giveaway
+    that starts late (e.g. after downtime) still runs for its full duration.
+    """
+    window = None
+    now = int(discord.utils.utcnow().timestamp())
+    if giveaway.scheduled and now - giveaway.created_at > LATE_START_GRACE:
+        window = (now, now + giveaway.ends_at - giveaway.created_at)
+        giveaway.created_at, giveaway.ends_at = window
+        embed = None  # the prepared one shows the old end time
+
+    embed = embed or render_giveaway(giveaway)
+    view = view or await GiveawayView.create(db, giveaway)
     guild = bot.get_guild(giveaway.guild_id)
     channel = guild.get_channel(giveaway.channel_id)
     msg = await channel.send(embed=embed, view=view)
     giveaway.message_id = msg.id
-    await db.set_message_id(msg.id, giveaway.id)
+    giveaway.scheduled = 0
+    await db.set_message_id(msg.id, giveaway.id, window)
 
     if giveaway.required_role_id and giveaway.ping_role:
         role = guild.get_role(giveaway.required_role_id)
@@ -103,13 +331,10 @@ async def end_giveaway(bot: Bot, db: AsyncDatabase, giveaway: Giveaway, channel)
 
 
 async def announce_winner(db: AsyncDatabase, giveaway: Giveaway, channel):
-    participants = await db.get_participants(giveaway.id)
-    print(f"Participants for Giveaway {giveaway.id} are ", participants)
-    if participants:
-        sysrand = random.SystemRandom()
-        winners = sysrand.sample(
-            participants, k=min(giveaway.winners_count, len(participants))
-        )
+    winners, rejected = await draw_winners(db, giveaway, channel.guild)
+    if rejected:
+        print(f"Skipped for Giveaway {giveaway.id}: {describe_rejections(rejected)}")
+    if winners:
         print(f"Winners for Giveaway {giveaway.id} are ", winners)
         await db.add_winners(giveaway.id, winners)
         winners_mentions = " ".join(f"<@{uid}>" for uid in winners)
@@ -117,13 +342,27 @@ async def announce_winner(db: AsyncDatabase, giveaway: Giveaway, channel):
             f"🎉 Congratulations {winners_mentions}! You won **{giveaway.prize}**!\n"
             f"📩 Direct Message the host to claim your prize!"
         )
+    elif rejected:
+        result_text = f"⚠️ No eligible participants remained in the giveaway **{giveaway.title}**. No winners this time."
     else:
         result_text = f"⚠️ No participants joined the giveaway **{giveaway.title}**. No winners this time."
 
+    k = giveaway.winners_count
+    if draw_was_capped(rejected, k) and len(winners) < k:
+        print(f"⚠️ Draw for Giveaway {giveaway.id} stopped after {rejection_cap(k)} ineligible entrants.")
+        result_text += (
+            f"\n⚠️ Only {len(winners)} of {giveaway.winners_count} winners were drawn: the draw "
+            f"stopped after {rejection_cap(k)} ineligible entrants."
+        )
+
     await channel.send(result_text)
 
 
 async def restore_views(bot: Bot, db: AsyncDatabase, giveaway: Giveaway):
+    if giveaway.message_id is None:
+        # Scheduled for later; nothing has been posted yet.
+        return
+
     channel = bot.get_channel(giveaway.channel_id)
     if channel is None:
         print(f"⚠️ Channel {giveaway.channel_id} not found. Skipping restore.")